@@ -13,10 +13,9 @@ copyright = '2020-Present, Alireza Hosseini'
 author = 'Alireza Hosseini'
 
 # The short X.Y version.
+_VERSION_RE = re.compile(r"__version__\s+=\s+'(?P<version>[^']+)'")
 with open(root / 'perke' / 'version.py') as f:
-    __version__ = re.search(
-        r'__version__\s+=\s+\'(?P<version>.*)\'', f.read()
-    ).group('version')
+    __version__ = _VERSION_RE.search(f.read()).group('version')
     # The short X.Y version.
     version = '.'.join(__version__.split('.')[:2])
     # The full version, including alpha/beta/rc tags.
@@ -1,36 +1,49 @@
-import re
-from typing import Any, Dict, Generator, List, Tuple, Union
+import functools
+import importlib
+import inspect
+import sys
+from typing import Any, Dict, Generator, List, Set, Tuple, Union
 
 import click
 import sphinx_click.ext as sphinx_click
-import typer
 from docutils import statemachine
 from sphinx import application
 
+_ANSI_RE = sphinx_click.ANSI_ESC_SEQ_RE
+
+
+@functools.lru_cache(maxsize=512)
+def _join_options(opts: Tuple[str, ...]) -> Tuple[str, bool]:
+    # Options such as --help repeat on every command of an app
+    return click.formatting.join_options(list(opts))
+
+
+def _write_option_opts(parameter: click.Option, opts: List[str]) -> str:
+    rv, _ = _join_options(tuple(opts))
+    if not parameter.is_flag and not parameter.count:
+        name = parameter.name
+        if parameter.metavar:
+            name = parameter.metavar.lstrip('<[{($').rstrip('>]})$')
+        rv += ' <{}>'.format(name)
+    return rv
+
 
 def _get_help_record(
     parameter: Union[click.Option, click.Argument]
 ) -> Tuple[str, str]:
-    def _write_option_opts(opts: List[str]) -> str:
-        rv, _ = click.formatting.join_options(opts)
-        if not parameter.is_flag and not parameter.count:
-            name = parameter.name
-            if parameter.metavar:
-                name = parameter.metavar.lstrip('<[{($').rstrip('>]})$')
-            rv += ' <{}>'.format(name)
-        return rv
-
+    upper_name = parameter.name.upper()
     if isinstance(parameter, click.Option):
-        rv = [_write_option_opts(parameter.opts)]
+        rv = [_write_option_opts(parameter, parameter.opts)]
         if parameter.secondary_opts:
-            rv.append(_write_option_opts(parameter.secondary_opts))
+            rv.append(_write_option_opts(parameter, parameter.secondary_opts))
     else:
-        rv = [parameter.name.upper()]
+        rv = [upper_name]
 
     out = []
     if getattr(parameter, 'help', None):
-        help_lines = parameter.help.replace('\b', '\b\b').split('\b')
-        out.extend(help_lines)
+        # Output lines are joined with newlines, so each backspace
+        # becomes a blank line, in a single pass over the help text
+        out.append(parameter.help.replace('\b', '\n\n'))
 
     extras = []
     if getattr(parameter, 'show_default', None):
@@ -41,8 +54,8 @@ def _get_help_record(
             extras.append(parameter_default.format(parameter.default))
 
     metavar = parameter.make_metavar()
-    if isinstance(parameter, click.Argument) and re.match(
-        rf'\[?{parameter.name.upper()}]?', metavar
+    if isinstance(parameter, click.Argument) and metavar.startswith(
+        (upper_name, f'[{upper_name}')
     ):
         metavar = parameter.type.name.upper()
 
@@ -66,42 +79,91 @@ def _format_parameter(
 ) -> Generator[str, None, None]:
     parameter_help = _get_help_record(parameter)
     yield '.. option:: {}'.format(parameter_help[0])
-    if parameter_help[1]:
-        yield ''
-        bar_enabled = False
-        for line in statemachine.string2lines(
-            sphinx_click.ANSI_ESC_SEQ_RE.sub('', parameter_help[1]),
-            tab_width=4,
-            convert_whitespace=True,
-        ):
-            if line == '\b':
-                bar_enabled = True
-                continue
-            if line == '':
-                bar_enabled = False
-            line = '| ' + line if bar_enabled else line
-            yield sphinx_click._indent(line)
+    if not parameter_help[1]:
+        return
+
+    yield ''
+    text = parameter_help[1]
+    # Only run the regex when there is an escape sequence to strip
+    if '\x1b' in text:
+        text = _ANSI_RE.sub('', text)
+
+    indent = sphinx_click._indent
+    lines = []
+    bar_enabled = False
+    for line in statemachine.string2lines(
+        text,
+        tab_width=4,
+        convert_whitespace=True,
+    ):
+        if line == '\b':
+            bar_enabled = True
+            continue
+        if line == '':
+            bar_enabled = False
+        lines.append(indent('| ' + line if bar_enabled else line))
+
+    yield from lines
 
 
 sphinx_click._format_option = _format_parameter
 sphinx_click._format_argument = _format_parameter
 
 
+@functools.lru_cache(maxsize=None)
+def _load_typer_command(module_path: str) -> Union[click.Command, click.Group]:
+    # Typer pulls in rich, so only import it once a directive needs it
+    import typer
+
+    module_name, attr_name = module_path.split(':', 1)
+    mod = importlib.import_module(module_name)
+    typer_instance = getattr(mod, attr_name)
+    return typer.main.get_command(typer_instance)
+
+
+def _get_source_filepaths(typer_instance: Any) -> Set[str]:
+    # Commands of an app are usually defined in other modules than the
+    # one exposing it, so collect the files of all of its callbacks
+    callbacks = [
+        command.callback for command in typer_instance.registered_commands
+    ]
+    if typer_instance.registered_callback is not None:
+        callbacks.append(typer_instance.registered_callback.callback)
+
+    filepaths = {
+        inspect.getsourcefile(callback)
+        for callback in callbacks
+        if callback is not None
+    }
+    for group in typer_instance.registered_groups:
+        filepaths |= _get_source_filepaths(group.typer_instance)
+
+    return filepaths
+
+
 class TyperDirective(sphinx_click.ClickDirective):
     def _load_module(
         self, module_path: str
     ) -> Union[click.Command, click.Group]:
+        command = _load_typer_command(module_path)
+
+        # Rebuild the page whenever the module exposing the app or any
+        # module defining one of its commands changes
         module_name, attr_name = module_path.split(':', 1)
-        mod = __import__(module_name, globals(), locals(), [attr_name])
-        typer_instance = getattr(mod, attr_name)
-        parser = typer.main.get_command(typer_instance)
-        return parser
+        module = sys.modules[module_name]
+        self.env.note_dependency(module.__file__)
+        for filepath in _get_source_filepaths(getattr(module, attr_name)):
+            self.env.note_dependency(filepath)
+
+        return command
 
 
 def setup(app: application.Sphinx) -> Dict[str, Any]:
     app.add_directive('typer', TyperDirective)
 
     return {
+        'version': '1.0',
+        'env_version': 1,
         'parallel_read_safe': True,
         'parallel_write_safe': True,
     }
@@ -0,0 +1,10 @@
+import runpy
+from pathlib import Path
+
+# Run every example in this interpreter, so perke and its dependencies
+# (hazm, nltk, networkx and scipy) are imported only once.
+examples_path = Path(__file__).resolve().parent
+for example_filepath in sorted(examples_path.glob('*/*/*.py')):
+    print(f'# {example_filepath.relative_to(examples_path)}')
+    runpy.run_path(str(example_filepath), run_name='__main__')
+    print()
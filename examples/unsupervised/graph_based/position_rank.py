@@ -5,7 +5,8 @@ from perke.unsupervised.graph_based import PositionRank
 # Define the set of valid part of speech tags to occur in the model.
 valid_pos_tags = {'NOUN', 'NOUN,EZ', 'ADJ', 'ADJ,EZ'}
 
-# Define the grammar for selecting the keyphrase candidates
+# Define the grammar for selecting the keyphrase candidates, it is
+# compiled once and reused by later calls with the same grammar.
 grammar = r"""
     NP:
         {<NOUN>}<VERB>
@@ -18,7 +19,7 @@ grammar = r"""
 extractor = PositionRank(valid_pos_tags=valid_pos_tags)
 
 # 2. Load the text.
-input_filepath = Path(__file__).parent.parent.parent / 'input.txt'
+input_filepath = Path(__file__).resolve().parents[2] / 'input.txt'
 extractor.load_text(
     input=input_filepath,
     word_normalization_method=None,
@@ -9,7 +9,7 @@ valid_pos_tags = {'NOUN', 'ADJ'}
 extractor = SingleRank(valid_pos_tags=valid_pos_tags)
 
 # 2. Load the text.
-input_filepath = Path(__file__).parent.parent.parent / 'input.txt'
+input_filepath = Path(__file__).resolve().parents[2] / 'input.txt'
 extractor.load_text(input=input_filepath, word_normalization_method=None)
 
 # 3. Select the longest sequences of nouns and adjectives as
@@ -1,8 +1,13 @@
+import sys
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Tuple
 
+# Slots drop the per-instance dict, but are only supported by
+# dataclasses from Python 3.10
+_dataclass_options = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_dataclass_options)
 class Sentence:
     """
     Represents a sentence data structure.
@@ -34,8 +39,34 @@ class Sentence:
         """
         return len(self.words)
 
+    def slice(
+        self, first: int, last: int
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Gets words, part of speech tags and normalized words of a span
+        of the sentence.
+
+        Parameters
+        ----------
+        first:
+            Offset of the first word of the span
+
+        last:
+            Offset of the last word of the span, inclusive
 
-@dataclass
+        Returns
+        -------
+        Tuple of words, pos tags and normalized words of the span
+        """
+        end = last + 1
+        return (
+            self.words[first:end],
+            self.pos_tags[first:end],
+            self.normalized_words[first:end],
+        )
+
+
+@dataclass(**_dataclass_options)
 class Candidate:
     """
     Represents a keyphrase candidate data structure.
@@ -106,4 +137,7 @@ class Candidate:
         self.all_words.append(words)
         self.offsets.append(offset)
         self.all_pos_tags.append(pos_tags)
-        self.normalized_words = normalized_words
+
+        # All occurrences share the same normalized words
+        if not self.normalized_words:
+            self.normalized_words = normalized_words
@@ -1,7 +1,19 @@
+import functools
+import heapq
 import logging
-from collections import defaultdict
+import sys
 from pathlib import Path
-from typing import Callable, DefaultDict, List, Optional, Set, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import hazm
 import nltk
@@ -12,6 +24,45 @@ from perke.base.types import WordNormalizationMethod
 from perke.utils.functions import is_alphanumeric
 from perke.utils.string import punctuation_marks
 
+_DEFAULT_GRAMMAR = r"""
+    NP:
+        {<NOUN>}<VERB>
+    NP:
+        {<DET(,EZ)?|NOUN(,EZ)?|NUM(,EZ)?|ADJ(,EZ)|PRON><DET(,EZ)|NOUN(,EZ)|NUM(,EZ)|ADJ(,EZ)|PRON>*}
+        <NOUN>}{<.*(,EZ)?>
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _get_stopwords() -> FrozenSet[str]:
+    """
+    Gets hazm stopwords and punctuation marks, stopwords are read only
+    once.
+
+    Returns
+    -------
+    Set of stopwords
+    """
+    return frozenset(hazm.stopwords_list()) | frozenset(punctuation_marks)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_grammar_parser(grammar: str) -> nltk.RegexpParser:
+    """
+    Gets a noun phrase parser for a grammar, parsers are cached by
+    grammar so each grammar is compiled only once.
+
+    Parameters
+    ----------
+    grammar:
+        Grammar defining part of speech patterns of noun phrases
+
+    Returns
+    -------
+    The parser
+    """
+    return nltk.RegexpParser(grammar)
+
 
 class Extractor:
     """
@@ -49,10 +100,8 @@ class Extractor:
         """
         self.word_normalization_method: Optional[str] = None
         self.sentences: List[Sentence] = []
-        self.candidates: DefaultDict[str, Candidate] = defaultdict(Candidate)
-        self.stopwords: Set[str] = set(hazm.stopwords_list()) | set(
-            punctuation_marks
-        )
+        self.candidates: Dict[str, Candidate] = {}
+        self.stopwords: Set[str] = set(_get_stopwords())
         if valid_pos_tags is None:
             valid_pos_tags = {'NOUN', 'ADJ'}
         self.valid_pos_tags: Set[str] = valid_pos_tags
@@ -93,22 +142,23 @@ class Extractor:
     def _is_redundant(
         self,
         candidate: str,
-        selected_candidates: List[str],
+        selected_canonical_forms: str,
         minimum_length: int = 1,
     ) -> bool:
         """
-        Test if a candidate is redundant with respect to a list of
-        already selected candidates. A candidate is considered redundant
-        if it is included in another candidate that is weighted higher
-        in the list.
+        Test if a candidate is redundant with respect to the already
+        selected candidates. A candidate is considered redundant if it
+        is included in another candidate that is weighted higher in the
+        list.
 
         Parameters
         ----------
         candidate:
             The canonical form of the candidate
 
-        selected_candidates:
-            The list of already selected candidates canonical forms
+        selected_canonical_forms:
+            The already selected candidates canonical forms, each one
+            followed by a newline.
 
         minimum_length:
             Minimum length of the candidate to be considered,
@@ -119,16 +169,18 @@ class Extractor:
         The result
         """
         # Only consider candidate with length greater than minimum
-        # length
-        if self.candidates[candidate].length < minimum_length:
+        # length, unknown candidates are not added by the lookup
+        candidate_object = self.candidates.get(candidate)
+        if (
+            candidate_object is None
+            or candidate_object.length < minimum_length
+        ):
             return False
 
-        # Loop through the already selected candidates
-        for sc in selected_candidates:
-            if candidate in sc:
-                return True
-
-        return False
+        # Canonical forms never contain newlines, so a single scan over
+        # the joined selected candidates can not match across two of
+        # them
+        return candidate in selected_canonical_forms
 
     def get_n_best(
         self,
@@ -157,29 +209,31 @@ class Extractor:
         List of `(candidate, weight)` tuples, `candidate` can be either
         canonical form or first occurrence joined words.
         """
-        # Sort candidates by descending weight
-        bests = sorted(
-            self.candidates,
-            key=lambda c: self.candidates[c].weight,
-            reverse=True,
-        )
-
         # Remove redundant candidates
         if remove_redundants:
+            # Candidates by descending weight, the n-best are usually
+            # found among the first few of them
+            bests = self._iterate_sorted_candidates(head_size=4 * n)
+
             # Initialize a new container for non-redundant candidates
             non_redundant_bests = []
 
+            # Newline separated canonical forms of the non-redundant
+            # candidates, searched instead of looping through them
+            selected_canonical_forms = ''
+
             # Loop through the best candidates
-            for c in bests:
+            for c, candidate in bests:
                 # Test whether candidate is redundant
                 if self._is_redundant(
                     candidate=c,
-                    selected_candidates=non_redundant_bests,
+                    selected_canonical_forms=selected_canonical_forms,
                 ):
                     continue
 
                 # Add the candidate otherwise
-                non_redundant_bests.append(c)
+                non_redundant_bests.append((c, candidate))
+                selected_canonical_forms += c + '\n'
 
                 # Break computation if the n-best are found
                 if len(non_redundant_bests) >= n:
@@ -188,10 +242,18 @@ class Extractor:
             # Copy non-redundant candidates in best container
             bests = non_redundant_bests
 
+        else:
+            # Only the n-best are needed, so avoid sorting all the
+            # candidates
+            bests = heapq.nlargest(
+                n,
+                self.candidates.items(),
+                key=lambda item: item[1].weight,
+            )
+
         # Get the list of best candidate
         n_best = []
-        for c in bests[: min(n, len(bests))]:
-            candidate = self.candidates[c]
+        for c, candidate in bests[: min(n, len(bests))]:
             if normalized:
                 # (canonical form, weight) tuples
                 n_best.append((c, candidate.weight))
@@ -209,6 +271,48 @@ class Extractor:
 
         return n_best
 
+    def _iterate_sorted_candidates(
+        self,
+        head_size: int,
+    ) -> Iterator[Tuple[str, Candidate]]:
+        """
+        Iterates over candidates by descending weight, only the first
+        `head_size` candidates are sorted unless more are consumed.
+
+        Parameters
+        ----------
+        head_size:
+            The number of candidates to sort first, negative values
+            are treated as `0`.
+
+        Returns
+        -------
+        Iterator of `(canonical form, candidate)` tuples
+        """
+        head_size = max(head_size, 0)
+
+        # Same order as sorted(), ties keep the insertion order
+        head = heapq.nlargest(
+            head_size,
+            self.candidates.items(),
+            key=lambda item: item[1].weight,
+        )
+        yield from head
+
+        # Fall back to sorting the rest of the candidates, the head is
+        # the stable sort prefix so the rest keeps the same order too
+        if len(self.candidates) > head_size:
+            head_canonical_forms = {c for c, _ in head}
+            yield from sorted(
+                (
+                    item
+                    for item in self.candidates.items()
+                    if item[0] not in head_canonical_forms
+                ),
+                key=lambda item: item[1].weight,
+                reverse=True,
+            )
+
     def _add_candidate_occurrence(
         self,
         words: List[str],
@@ -235,12 +339,14 @@ class Extractor:
             List of normalized words of the occurrence
         """
         # Build the canonical form of the candidate
-        canonical_form = ' '.join(normalized_words)
+        canonical_form = sys.intern(' '.join(normalized_words))
 
         # Create candidate if not exist and add occurrence
-        self.candidates[canonical_form].add_occurrence(
-            words, offset, pos_tags, normalized_words
-        )
+        candidate = self.candidates.get(canonical_form)
+        if candidate is None:
+            candidate = self.candidates[canonical_form] = Candidate()
+
+        candidate.add_occurrence(words, offset, pos_tags, normalized_words)
 
     def _select_candidates_with_longest_pos_sequences(
         self,
@@ -294,37 +400,44 @@ class Extractor:
         valid_values: `set[str]`
             The valid values
         """
+        add_candidate_occurrence = self._add_candidate_occurrence
+
         # Loop through the sentences
         offset_shift = 0
-        for i, sentence in enumerate(self.sentences):
-            sequence_offsets = []
+        for sentence in self.sentences:
+            # Offsets of the first and last word of the current
+            # sequence, sequences are contiguous so nothing else is
+            # needed
+            first = None
+            last = None
+            last_offset = sentence.length - 1
 
             # Loop through the key result
             for j, value in enumerate(key(sentence)):
-                # Add candidate offset in sequence and continue if not
-                # last word
+                # Extend the sequence and continue if not last word
                 if value in valid_values:
-                    sequence_offsets.append(j)
-                    if j < (sentence.length - 1):
+                    if first is None:
+                        first = j
+                    last = j
+                    if j < last_offset:
                         continue
 
                 # Add sequence as candidate if it is not empty
-                if len(sequence_offsets) > 0:
-                    first = sequence_offsets[0]
-                    last = sequence_offsets[-1]
+                if first is not None:
+                    words, pos_tags, normalized_words = sentence.slice(
+                        first, last
+                    )
 
                     # Add the n-gram as a new candidate occurrence
-                    self._add_candidate_occurrence(
-                        words=sentence.words[first : last + 1],
+                    add_candidate_occurrence(
+                        words=words,
                         offset=offset_shift + first,
-                        pos_tags=sentence.pos_tags[first : last + 1],
-                        normalized_words=sentence.normalized_words[
-                            first : last + 1
-                        ],
+                        pos_tags=pos_tags,
+                        normalized_words=normalized_words,
                     )
 
-                # Flush sequence offsets
-                sequence_offsets = []
+                # Flush the sequence
+                first = None
 
             offset_shift += sentence.length
 
@@ -349,26 +462,21 @@ class Extractor:
                     <NOUN>}{<.*(,EZ)?>
                 \"""
         """
-        # Initialize default grammar if none provided
+        # Use the default grammar if none provided
         if grammar is None:
-            grammar = r"""
-                NP:
-                    {<NOUN>}<VERB>
-                NP:
-                    {<DET(,EZ)?|NOUN(,EZ)?|NUM(,EZ)?|ADJ(,EZ)|PRON><DET(,EZ)|NOUN(,EZ)|NUM(,EZ)|ADJ(,EZ)|PRON>*}
-                    <NOUN>}{<.*(,EZ)?>
-            """
+            grammar = _DEFAULT_GRAMMAR
 
-        # Initialize parser
-        parser = nltk.RegexpParser(grammar)
+        # Get the parser
+        parser = _get_grammar_parser(grammar)
+
+        add_candidate_occurrence = self._add_candidate_occurrence
 
         # Loop through the sentences
         offset_shift = 0
-        for i, sentence in enumerate(self.sentences):
-            # Convert sentence as list of (offset, pos) tuples
-            tuples = [
-                (str(j), sentence.pos_tags[j]) for j in range(sentence.length)
-            ]
+        for sentence in self.sentences:
+            # Convert sentence as list of (offset, pos) tuples, the
+            # parser only reads the tags so offsets are kept as ints
+            tuples = list(enumerate(sentence.pos_tags))
 
             # Parse sentence
             tree = parser.parse(tuples)
@@ -380,17 +488,18 @@ class Extractor:
 
                     # Get the first and last offset of the current
                     # candidate
-                    first = int(leaves[0][0])
-                    last = int(leaves[-1][0])
+                    first = leaves[0][0]
+                    last = leaves[-1][0]
+                    words, pos_tags, normalized_words = sentence.slice(
+                        first, last
+                    )
 
                     # Add the noun phrase to the candidate container
-                    self._add_candidate_occurrence(
-                        words=sentence.words[first : last + 1],
+                    add_candidate_occurrence(
+                        words=words,
                         offset=offset_shift + first,
-                        pos_tags=sentence.pos_tags[first : last + 1],
-                        normalized_words=sentence.normalized_words[
-                            first : last + 1
-                        ],
+                        pos_tags=pos_tags,
+                        normalized_words=normalized_words,
                     )
 
             # Compute offset shift
@@ -443,45 +552,52 @@ class Extractor:
         if invalid_pos_tags is None:
             invalid_pos_tags = set()
 
-        # Loop through the candidates
-        for c in list(self.candidates):
-            # Get the candidate
-            candidate = self.candidates[c]
+        # Words made of punctuation marks only are emptied by this table
+        punctuation_marks_table = str.maketrans('', '', punctuation_marks)
 
+        # Collect the candidates passing all conditions instead of
+        # deleting the others one by one
+        kept_candidates = {}
+
+        # Loop through the candidates, conditions are checked from the
+        # cheapest to the most expensive one
+        for c, candidate in self.candidates.items():
             # Get the words from the first occurrence
             words = candidate.all_words[0]
 
+            # Discard candidates with long length
+            if len(candidate.normalized_words) > maximum_length:
+                continue
+
+            # Discard candidates containing short words
+            if min(len(word) for word in words) < minimum_word_characters:
+                continue
+
+            # Discard short candidates
+            if len(''.join(words)) < minimum_characters:
+                continue
+
+            # Discard if not containing only alphanumeric characters
+            if alphanumeric_only and not all(
+                is_alphanumeric(word, valid_punctuation_marks)
+                for word in words
+            ):
+                continue
+
             # Discard if words are in the stoplist
-            if set(words).intersection(stopwords):
-                del self.candidates[c]
+            if not stopwords.isdisjoint(words):
+                continue
 
             # Discard if any of pos tags are in the invalid pos tags
-            elif set(candidate.all_pos_tags[0]).intersection(invalid_pos_tags):
-                del self.candidates[c]
+            if not invalid_pos_tags.isdisjoint(candidate.all_pos_tags[0]):
+                continue
 
             # Discard if containing words composed of only punctuation
-            elif any(
-                [set(word).issubset(set(punctuation_marks)) for word in words]
+            if any(
+                not word.translate(punctuation_marks_table) for word in words
             ):
-                del self.candidates[c]
+                continue
 
-            # Discard short candidates
-            elif len(''.join(words)) < minimum_characters:
-                del self.candidates[c]
-
-            # Discard candidates containing short words
-            elif min([len(word) for word in words]) < minimum_word_characters:
-                del self.candidates[c]
+            kept_candidates[c] = candidate
 
-            # Discard candidates with long length
-            elif len(candidate.normalized_words) > maximum_length:
-                del self.candidates[c]
-
-            # Discard if not containing only alphanumeric characters
-            elif alphanumeric_only and not all(
-                [
-                    is_alphanumeric(word, valid_punctuation_marks)
-                    for word in words
-                ]
-            ):
-                del self.candidates[c]
+        self.candidates = kept_candidates
@@ -1,5 +1,8 @@
+import functools
+import sys
+from itertools import chain
 from pathlib import Path
-from typing import List
+from typing import List, Union
 
 import hazm
 
@@ -7,6 +10,68 @@ from perke.base.data_structures import Sentence
 from perke.base.types import WordNormalizationMethod
 
 
+@functools.lru_cache(maxsize=None)
+def _get_stemmer() -> hazm.Stemmer:
+    """
+    Gets the stemmer shared by all readers, hazm stemmers keep no state
+    between calls.
+
+    Returns
+    -------
+    The hazm stemmer instance
+    """
+    return hazm.Stemmer()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_normalizer() -> hazm.Normalizer:
+    """
+    Gets the normalizer shared by all readers, hazm normalizers keep no
+    state between calls.
+
+    Returns
+    -------
+    The hazm normalizer instance
+    """
+    return hazm.Normalizer()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_lemmatizer() -> hazm.Lemmatizer:
+    """
+    Gets the lemmatizer shared by all readers, its word lists are loaded
+    only once.
+
+    Returns
+    -------
+    The hazm lemmatizer instance
+    """
+    return hazm.Lemmatizer()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pos_tagger(universal_pos_tags: bool) -> hazm.POSTagger:
+    """
+    Gets the pos tagger shared by all readers using the same kind of
+    tags, the tagger model is loaded only once for each of them.
+
+    Parameters
+    ----------
+    universal_pos_tags:
+        Whether to use universal part of speech tags or not
+
+    Returns
+    -------
+    The hazm pos tagger instance
+    """
+    return hazm.POSTagger(
+        model=str(
+            Path(__file__).parent.parent / 'resources' / 'pos_tagger.model'
+        ),
+        universal_tag=universal_pos_tags,
+    )
+
+
 class Reader:
     """
     Base Reader
@@ -50,15 +115,10 @@ class Reader:
         self.word_normalization_method: WordNormalizationMethod = (
             word_normalization_method
         )
-        self.normalizer: hazm.Normalizer = hazm.Normalizer()
-        self.stemmer: hazm.Stemmer = hazm.Stemmer()
-        self.lemmatizer: hazm.Lemmatizer = hazm.Lemmatizer()
-        self.pos_tagger: hazm.POSTagger = hazm.POSTagger(
-            model=str(
-                Path(__file__).parent.parent / 'resources' / 'pos_tagger.model'
-            ),
-            universal_tag=universal_pos_tags,
-        )
+        self.normalizer: hazm.Normalizer = _get_normalizer()
+        self.stemmer: hazm.Stemmer = _get_stemmer()
+        self.lemmatizer: hazm.Lemmatizer = _get_lemmatizer()
+        self.pos_tagger: hazm.POSTagger = _get_pos_tagger(universal_pos_tags)
 
 
 class RawTextReader(Reader):
@@ -73,9 +133,9 @@ class RawTextReader(Reader):
 
     def __init__(
         self,
-        input: str,
+        input: Union[str, Path],
         word_normalization_method: WordNormalizationMethod,
-        universal_pos_tags,
+        universal_pos_tags: bool,
     ) -> None:
         """
         Initializes the reader.
@@ -97,9 +157,7 @@ class RawTextReader(Reader):
 
         # If input is a filepath
         if isinstance(input, Path):
-            assert input.exists()
-            with open(input, encoding='utf-8') as file:
-                self.text: str = file.read()
+            self.text: str = input.read_text(encoding='utf-8')
 
         # If input is raw text
         else:
@@ -115,24 +173,51 @@ class RawTextReader(Reader):
         """
         word_normalization_method = self.word_normalization_method
         normalized_text = self.normalizer.normalize(self.text)
-        sentences = []
-        for sentence in hazm.sent_tokenize(normalized_text):
-            words = hazm.word_tokenize(sentence)
-            pos_tags = [tag for _, tag in self.pos_tagger.tag(words)]
 
-            if word_normalization_method == 'stemming':
-                normalized_words = [self.stemmer.stem(word) for word in words]
+        # hazm keeps its tokenizers on these functions, so they are
+        # built once and only the lookups are saved here
+        word_tokenize = hazm.word_tokenize
+        all_words = [
+            word_tokenize(sentence)
+            for sentence in hazm.sent_tokenize(normalized_text)
+        ]
 
-            elif word_normalization_method == 'lemmatization':
-                normalized_words = [
-                    self.lemmatizer.lemmatize(word) for word in words
-                ]
+        if word_normalization_method == 'stemming':
+            normalize_word = self.stemmer.stem
 
-            # No normalization
-            else:
-                normalized_words = words
+        elif word_normalization_method == 'lemmatization':
+            normalize_word = self.lemmatizer.lemmatize
 
-            sentence = Sentence(words, pos_tags, normalized_words)
-            sentences.append(sentence)
-
-        return sentences
+        # No normalization
+        else:
+            normalize_word = None
+
+        # Tag all the sentences in a single call
+        all_pos_tags = [
+            [sys.intern(tag) for _, tag in tagged_words]
+            for tagged_words in self.pos_tagger.tag_sents(all_words)
+        ]
+
+        # Normalize each distinct word of the text only once, normalized
+        # forms are interned since they are used as candidate and graph
+        # keys
+        if normalize_word is not None:
+            normalized_forms = {
+                word: sys.intern(normalize_word(word))
+                for word in set(chain.from_iterable(all_words))
+            }
+            all_normalized_words = [
+                [normalized_forms[word] for word in words]
+                for words in all_words
+            ]
+
+        # No normalization
+        else:
+            all_normalized_words = all_words
+
+        return [
+            Sentence(words, pos_tags, normalized_words)
+            for words, pos_tags, normalized_words in zip(
+                all_words, all_pos_tags, all_normalized_words
+            )
+        ]
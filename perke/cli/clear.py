@@ -19,8 +19,8 @@ def clear() -> None:
     Function version of `clear_command` to be available in the package.
     """
     resources_path = join(dirname(dirname(__file__)), 'resources')
-    for file_name in os.listdir(resources_path):
-        if file_name != 'README.md':
-            file_path = join(resources_path, file_name)
-            os.remove(file_path)
-            typer.secho(f'{file_name} removed.', fg='green')
+    with os.scandir(resources_path) as entries:
+        for entry in entries:
+            if entry.name != 'README.md':
+                os.remove(entry.path)
+                typer.secho(f'{entry.name} removed.', fg='green')
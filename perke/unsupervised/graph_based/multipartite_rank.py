@@ -1,5 +1,5 @@
 import math
-from itertools import combinations
+from itertools import combinations, product
 from typing import Dict, Optional, Set
 
 import networkx as nx
@@ -103,34 +103,35 @@ class MultipartiteRank(TopicRank):
         # Adding the nodes to the graph
         self.graph.add_nodes_from(self.candidates.keys())
 
-        # Pre-compute edge weights
-        for node_i, node_j in combinations(self.candidates.keys(), 2):
-            # Discard intra-topic edges
-            if self.topic_ids[node_i] == self.topic_ids[node_j]:
-                continue
-
-            weights = []
-            candidate_i = self.candidates[node_i]
-            candidate_j = self.candidates[node_j]
-            for p_i in candidate_i.offsets:
-                for p_j in candidate_j.offsets:
-                    # Compute gap
-                    gap = abs(p_i - p_j)
-
-                    # Alter gap according to candidate length
-                    if p_i < p_j:
-                        gap -= len(candidate_i.normalized_words) - 1
-                    if p_j < p_i:
-                        gap -= len(candidate_j.normalized_words) - 1
-
-                    weights.append(1.0 / gap)
-
-            # Add weighted edges
-            if weights:
-                # node_i -> node_j
-                self.graph.add_edge(node_i, node_j, weight=sum(weights))
-                # node_j -> node_i
-                self.graph.add_edge(node_j, node_i, weight=sum(weights))
+        # Pre-compute edge weights, only pairs of candidates from
+        # different topics are connected
+        for topic_i, topic_j in combinations(self.topics, 2):
+            for node_i, node_j in product(topic_i, topic_j):
+                weights = []
+                candidate_i = self.candidates[node_i]
+                candidate_j = self.candidates[node_j]
+
+                # Gaps are altered according to the length of the
+                # candidate occurring first
+                shortening_i = candidate_i.length - 1
+                shortening_j = candidate_j.length - 1
+                for p_i in candidate_i.offsets:
+                    for p_j in candidate_j.offsets:
+                        gap = abs(p_i - p_j)
+                        if p_i < p_j:
+                            gap -= shortening_i
+                        elif p_j < p_i:
+                            gap -= shortening_j
+
+                        weights.append(1.0 / gap)
+
+                # Add weighted edges
+                if weights:
+                    weight = sum(weights)
+                    # node_i -> node_j
+                    self.graph.add_edge(node_i, node_j, weight=weight)
+                    # node_j -> node_i
+                    self.graph.add_edge(node_j, node_i, weight=weight)
 
     def _adjust_weights(self, alpha: float = 1.1) -> None:
         """
@@ -143,6 +144,7 @@ class MultipartiteRank(TopicRank):
             adjustment, defaults to `1.1`.
         """
         weighted_edges = {}
+        adjacency = self.graph.adj
 
         # Topical boosting
         for topic in self.topics:
@@ -156,22 +158,26 @@ class MultipartiteRank(TopicRank):
             # Get the first occurring candidate
             first = topic[offsets.index(min(offsets))]
 
+            # Get the neighbors of the other candidates of the topic
+            others_neighbors = [adjacency[c] for c in topic if c != first]
+
             # Find the nodes to which it connects
-            for start, end in self.graph.edges(first):
-                boosters = []
-                for c in topic:
-                    if c != first and self.graph.has_edge(c, end):
-                        boosters.append(self.graph[c][end]['weight'])
+            for end in adjacency[first]:
+                boosters = [
+                    neighbors[end]['weight']
+                    for neighbors in others_neighbors
+                    if end in neighbors
+                ]
 
                 if boosters:
-                    weighted_edges[(start, end)] = sum(boosters)
+                    weighted_edges[(first, end)] = sum(boosters)
 
         # Update edge weights
         for nodes, boosters in weighted_edges.items():
             node_i, node_j = nodes
             position_i = 1.0 / (1 + self.candidates[node_i].offsets[0])
             position_i = math.exp(position_i)
-            self.graph[node_j][node_i]['weight'] += (
+            adjacency[node_j][node_i]['weight'] += (
                 boosters * alpha * position_i
             )
 
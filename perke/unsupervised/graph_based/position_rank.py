@@ -76,15 +76,6 @@ class PositionRank(SingleRank):
         maximum_length: `int`
             Maximum length in words of the candidate, defaults to `3`.
         """
-        if grammar is None:
-            grammar = r"""
-                NP:
-                    {<NOUN>}<VERB>
-                NP:
-                    {<DET(,EZ)?|NOUN(,EZ)?|NUM(,EZ)?|ADJ(,EZ)|PRON><DET(,EZ)|NOUN(,EZ)|NUM(,EZ)|ADJ(,EZ)|PRON>*}
-                    <NOUN>}{<.*(,EZ)?>
-            """
-
         # Select sequence of noun phrases with given pattern
         self._select_candidates_with_grammar(grammar=grammar)
 
@@ -109,7 +100,7 @@ class PositionRank(SingleRank):
         # (word, position) tuples
         flatten_text = []
         shift = 0
-        for i, sentence in enumerate(self.sentences):
+        for sentence in self.sentences:
             for j, word in enumerate(sentence.normalized_words):
                 if sentence.pos_tags[j] in self.valid_pos_tags:
                     flatten_text.append((word, shift + j))
@@ -1,3 +1,35 @@
+import functools
+from typing import Dict, Optional
+
+
+@functools.lru_cache(maxsize=16)
+def _get_removal_table(
+    valid_punctuation_marks: str,
+) -> Optional[Dict[int, None]]:
+    """
+    Gets a translation table removing the given punctuation marks,
+    tables are cached so each one is built only once.
+
+    Parameters
+    ----------
+    valid_punctuation_marks:
+        Whitespace separated punctuation marks to remove
+
+    Returns
+    -------
+    The translation table, `None` if any of the punctuation marks is
+    longer than one character since those must be removed as
+    substrings.
+    """
+    punctuation_marks = valid_punctuation_marks.split()
+    if any(
+        len(punctuation_mark) > 1 for punctuation_mark in punctuation_marks
+    ):
+        return None
+
+    return str.maketrans('', '', ''.join(punctuation_marks))
+
+
 def is_alphanumeric(word: str, valid_punctuation_marks: str = '-') -> bool:
     """
     Check if a word contains only alphanumeric
@@ -9,12 +41,17 @@ def is_alphanumeric(word: str, valid_punctuation_marks: str = '-') -> bool:
         The given word
 
     valid_punctuation_marks:
-        Punctuation marks that are valid, defaults to `'-'`.
+        Punctuation marks that are valid, separated by whitespaces,
+        defaults to `'-'`.
 
     Returns
     -------
     The result
     """
-    for punctuation_mark in valid_punctuation_marks.split():
-        word = word.replace(punctuation_mark, '')
+    table = _get_removal_table(valid_punctuation_marks)
+    if table is None:
+        for punctuation_mark in valid_punctuation_marks.split():
+            word = word.replace(punctuation_mark, '')
+    else:
+        word = word.translate(table)
     return word.isalnum()
@@ -0,0 +1,73 @@
+from typing import List, Tuple
+
+import pytest
+
+from perke.base.extractor import Extractor
+
+
+def get_n_best_reference(
+    extractor: Extractor, n: int
+) -> List[Tuple[str, float]]:
+    # Redundancy removal over a full sort of the candidates
+    bests = sorted(
+        extractor.candidates.items(),
+        key=lambda item: item[1].weight,
+        reverse=True,
+    )
+    n_best = []
+    for c, candidate in bests:
+        if any(c in selected for selected, _ in n_best):
+            continue
+
+        n_best.append((c, candidate.weight))
+        if len(n_best) >= n:
+            break
+
+    return n_best[: min(n, len(n_best))]
+
+
+@pytest.fixture
+def extractor() -> Extractor:
+    extractor = Extractor()
+
+    # The heaviest candidates are all redundant with the first one, so
+    # more than 4n candidates are skipped for small n
+    canonical_forms = ['زبان طبیعی پردازش متن']
+    canonical_forms += ['زبان', 'طبیعی', 'پردازش', 'متن', 'زبان طبیعی']
+    canonical_forms += ['طبیعی پردازش', 'پردازش متن', 'زبان طبیعی پردازش']
+    canonical_forms += [f'واژه{i}' for i in range(20)]
+    for i, canonical_form in enumerate(canonical_forms):
+        normalized_words = canonical_form.split()
+        extractor._add_candidate_occurrence(
+            words=normalized_words,
+            offset=i,
+            pos_tags=['NOUN'] * len(normalized_words),
+            normalized_words=normalized_words,
+        )
+        # Heavier first, with ties among the remaining candidates
+        extractor.candidates[canonical_form].weight = (
+            100.0 - i if i < 9 else float(i % 3)
+        )
+
+    return extractor
+
+
+@pytest.mark.parametrize('n', [-1, 0, 1, 2, 5, 50])
+def test_get_n_best_remove_redundants(extractor: Extractor, n: int) -> None:
+    n_best = extractor.get_n_best(n=n, remove_redundants=True, normalized=True)
+    assert n_best == get_n_best_reference(extractor, n)
+
+
+@pytest.mark.parametrize('head_size', [-4, 0, 4, 100])
+def test_iterate_sorted_candidates(
+    extractor: Extractor, head_size: int
+) -> None:
+    sorted_candidates = sorted(
+        extractor.candidates.items(),
+        key=lambda item: item[1].weight,
+        reverse=True,
+    )
+    assert (
+        list(extractor._iterate_sorted_candidates(head_size))
+        == sorted_candidates
+    )
@@ -0,0 +1,19 @@
+from perke.utils.functions import is_alphanumeric
+
+
+def test_is_alphanumeric_default() -> None:
+    assert is_alphanumeric('پردازش')
+    assert is_alphanumeric('a-b')
+    assert not is_alphanumeric('a.b')
+
+
+def test_is_alphanumeric_single_character_marks() -> None:
+    assert is_alphanumeric('a-b.c', '- .')
+    assert not is_alphanumeric('a-b.c', '-')
+
+
+def test_is_alphanumeric_multi_character_marks() -> None:
+    # Marks are whitespace separated tokens removed as substrings
+    assert is_alphanumeric('a-.b', '-.')
+    assert not is_alphanumeric('a-b', '-.')
+    assert not is_alphanumeric('a.b', '-.')